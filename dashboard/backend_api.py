@@ -60,17 +60,18 @@ def list_licitacoes(orgao: Optional[str] = None, tipo: Optional[str] = None, sit
     conn = get_db_connection()
     query = "SELECT id, title, description, numero, ano, orgao_nome, unidade_nome, esfera_nome, municipio_nome, uf, modalidade_licitacao_nome, situacao_nome, data_publicacao_pncp, data_inicio_vigencia, data_fim_vigencia, valor_global FROM licitacoes WHERE 1=1"
     params = []
+    # filtros por nome resolvidos para as chaves inteiras das dimensões
     if orgao:
-        query += " AND orgao_nome = ?"
+        query += " AND orgao_sk IN (SELECT sk FROM dim_orgao WHERE nome = ?)"
         params.append(orgao)
     if tipo:
-        query += " AND modalidade_licitacao_nome = ?"
+        query += " AND modalidade_sk IN (SELECT sk FROM dim_modalidade WHERE nome = ?)"
         params.append(tipo)
     if situacao:
-        query += " AND situacao_nome = ?"
+        query += " AND situacao_sk IN (SELECT sk FROM dim_situacao WHERE nome = ?)"
         params.append(situacao)
     if municipio:
-        query += " AND municipio_nome = ?"
+        query += " AND municipio_sk IN (SELECT sk FROM dim_municipio WHERE nome = ?)"
         params.append(municipio)
     if data_inicio:
         query += " AND data_publicacao_pncp >= ?"
@@ -0,0 +1,249 @@
+# dimensoes.py
+"""
+Tabelas de dimensão (órgão, unidade, município, modalidade, situação, esfera e poder)
+com chaves inteiras para a tabela de licitações.
+
+Os textos repetidos em cada licitação ficam uma única vez em `dim_*`; a tabela
+`licitacoes_fato` guarda apenas a chave inteira (`*_sk`). A view `licitacoes`
+refaz os joins e expõe as mesmas colunas da tabela antiga, de modo que os
+leitores existentes (API, exportação markdown) continuam funcionando.
+
+Uso para migrar um banco existente:  python dimensoes.py database_lite.db
+"""
+import sqlite3
+import sys
+from typing import Any, Optional
+
+# ============ DEFINIÇÃO DAS DIMENSÕES ============
+# dimensão -> (tabela, {coluna em licitacoes: coluna na dimensão})
+DIMENSOES: dict[str, tuple[str, dict[str, str]]] = {
+    "orgao":      ("dim_orgao",      {"orgao_id": "id", "orgao_cnpj": "cnpj", "orgao_nome": "nome"}),
+    "unidade":    ("dim_unidade",    {"unidade_id": "id", "unidade_codigo": "codigo", "unidade_nome": "nome"}),
+    "esfera":     ("dim_esfera",     {"esfera_id": "id", "esfera_nome": "nome"}),
+    "poder":      ("dim_poder",      {"poder_id": "id", "poder_nome": "nome"}),
+    "municipio":  ("dim_municipio",  {"municipio_id": "id", "municipio_nome": "nome", "uf": "uf"}),
+    "modalidade": ("dim_modalidade", {"modalidade_licitacao_id": "id", "modalidade_licitacao_nome": "nome"}),
+    "situacao":   ("dim_situacao",   {"situacao_id": "id", "situacao_nome": "nome"}),
+}
+
+COLUNAS_DIMENSAO = {col for _, colunas in DIMENSOES.values() for col in colunas}
+
+SCHEMA_SQL = """
+-- dimensões (sk = chave substituta inteira)
+CREATE TABLE IF NOT EXISTS dim_orgao (
+    sk INTEGER PRIMARY KEY,
+    id TEXT,
+    cnpj TEXT,
+    nome TEXT,
+    UNIQUE (id, cnpj, nome)
+);
+CREATE TABLE IF NOT EXISTS dim_unidade (
+    sk INTEGER PRIMARY KEY,
+    id TEXT,
+    codigo TEXT,
+    nome TEXT,
+    UNIQUE (id, codigo, nome)
+);
+CREATE TABLE IF NOT EXISTS dim_esfera (
+    sk INTEGER PRIMARY KEY,
+    id TEXT,
+    nome TEXT,
+    UNIQUE (id, nome)
+);
+CREATE TABLE IF NOT EXISTS dim_poder (
+    sk INTEGER PRIMARY KEY,
+    id TEXT,
+    nome TEXT,
+    UNIQUE (id, nome)
+);
+CREATE TABLE IF NOT EXISTS dim_municipio (
+    sk INTEGER PRIMARY KEY,
+    id TEXT,
+    nome TEXT,
+    uf TEXT,
+    UNIQUE (id, nome, uf)
+);
+CREATE TABLE IF NOT EXISTS dim_modalidade (
+    sk INTEGER PRIMARY KEY,
+    id TEXT,
+    nome TEXT,
+    UNIQUE (id, nome)
+);
+CREATE TABLE IF NOT EXISTS dim_situacao (
+    sk INTEGER PRIMARY KEY,
+    id TEXT,
+    nome TEXT,
+    UNIQUE (id, nome)
+);
+CREATE INDEX IF NOT EXISTS idx_dim_orgao_nome      ON dim_orgao(nome);
+CREATE INDEX IF NOT EXISTS idx_dim_municipio_nome  ON dim_municipio(nome);
+CREATE INDEX IF NOT EXISTS idx_dim_modalidade_nome ON dim_modalidade(nome);
+CREATE INDEX IF NOT EXISTS idx_dim_situacao_nome   ON dim_situacao(nome);
+
+-- licitacoes_fato (colunas = chaves JSON, exceto as que foram para as dimensões)
+CREATE TABLE IF NOT EXISTS licitacoes_fato (
+    id TEXT PRIMARY KEY,
+    "index" TEXT,
+    doc_type TEXT,
+    title TEXT,
+    description TEXT,
+    item_url TEXT,
+    document_type TEXT,
+    createdAt DATETIME,
+    numero TEXT,
+    ano INTEGER,
+    numero_sequencial INTEGER,
+    numero_sequencial_compra_ata INTEGER,
+    numero_controle_pncp TEXT,
+    orgao_sk INTEGER REFERENCES dim_orgao(sk),
+    orgao_subrogado_id TEXT,
+    orgao_subrogado_nome TEXT,
+    unidade_sk INTEGER REFERENCES dim_unidade(sk),
+    esfera_sk INTEGER REFERENCES dim_esfera(sk),
+    poder_sk INTEGER REFERENCES dim_poder(sk),
+    municipio_sk INTEGER REFERENCES dim_municipio(sk),
+    modalidade_sk INTEGER REFERENCES dim_modalidade(sk),
+    situacao_sk INTEGER REFERENCES dim_situacao(sk),
+    data_publicacao_pncp DATETIME,
+    data_atualizacao_pncp DATETIME,
+    data_assinatura DATETIME,
+    data_inicio_vigencia DATETIME,
+    data_fim_vigencia DATETIME,
+    cancelado BOOLEAN,
+    valor_global REAL,
+    tem_resultado BOOLEAN,
+    tipo_id TEXT,
+    tipo_nome TEXT,
+    tipo_contrato_id TEXT,
+    fonte_orcamentaria TEXT,
+    fonte_orcamentaria_id TEXT,
+    fonte_orcamentaria_nome TEXT,
+    tipo_contrato_nome TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_licitacoes_fato_controle
+  ON licitacoes_fato(numero_controle_pncp);
+CREATE INDEX IF NOT EXISTS idx_licitacoes_fato_orgao      ON licitacoes_fato(orgao_sk);
+CREATE INDEX IF NOT EXISTS idx_licitacoes_fato_municipio  ON licitacoes_fato(municipio_sk);
+CREATE INDEX IF NOT EXISTS idx_licitacoes_fato_modalidade ON licitacoes_fato(modalidade_sk);
+CREATE INDEX IF NOT EXISTS idx_licitacoes_fato_situacao   ON licitacoes_fato(situacao_sk);
+"""
+
+# mesmas colunas (e ordem) da antiga tabela licitacoes; as chaves *_sk vão ao
+# final para permitir filtros por inteiro sem mudar o formato das respostas
+VIEW_SQL = """
+CREATE VIEW IF NOT EXISTS licitacoes AS
+SELECT
+    f.id, f."index", f.doc_type, f.title, f.description, f.item_url, f.document_type,
+    f.createdAt, f.numero, f.ano, f.numero_sequencial, f.numero_sequencial_compra_ata,
+    f.numero_controle_pncp,
+    o.id AS orgao_id, o.cnpj AS orgao_cnpj, o.nome AS orgao_nome,
+    f.orgao_subrogado_id, f.orgao_subrogado_nome,
+    u.id AS unidade_id, u.codigo AS unidade_codigo, u.nome AS unidade_nome,
+    e.id AS esfera_id, e.nome AS esfera_nome,
+    p.id AS poder_id, p.nome AS poder_nome,
+    m.id AS municipio_id, m.nome AS municipio_nome, m.uf AS uf,
+    ml.id AS modalidade_licitacao_id, ml.nome AS modalidade_licitacao_nome,
+    s.id AS situacao_id, s.nome AS situacao_nome,
+    f.data_publicacao_pncp, f.data_atualizacao_pncp, f.data_assinatura,
+    f.data_inicio_vigencia, f.data_fim_vigencia, f.cancelado, f.valor_global,
+    f.tem_resultado, f.tipo_id, f.tipo_nome, f.tipo_contrato_id,
+    f.fonte_orcamentaria, f.fonte_orcamentaria_id, f.fonte_orcamentaria_nome,
+    f.tipo_contrato_nome,
+    f.orgao_sk, f.unidade_sk, f.esfera_sk, f.poder_sk,
+    f.municipio_sk, f.modalidade_sk, f.situacao_sk
+FROM licitacoes_fato f
+LEFT JOIN dim_orgao      o  ON o.sk  = f.orgao_sk
+LEFT JOIN dim_unidade    u  ON u.sk  = f.unidade_sk
+LEFT JOIN dim_esfera     e  ON e.sk  = f.esfera_sk
+LEFT JOIN dim_poder      p  ON p.sk  = f.poder_sk
+LEFT JOIN dim_municipio  m  ON m.sk  = f.municipio_sk
+LEFT JOIN dim_modalidade ml ON ml.sk = f.modalidade_sk
+LEFT JOIN dim_situacao   s  ON s.sk  = f.situacao_sk;
+"""
+
+
+# ============ CACHE DE CHAVES ============
+class CacheDimensoes:
+    """Mantém em memória o mapa (atributos da dimensão) -> sk, carregado uma vez do banco."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self._chaves: dict[str, dict[tuple, int]] = {}
+        for dim, (tabela, colunas) in DIMENSOES.items():
+            cols = ", ".join(colunas.values())
+            self._chaves[dim] = {
+                tuple(valores): sk
+                for sk, *valores in conn.execute(f"SELECT sk, {cols} FROM {tabela}")
+            }
+
+    def chave(self, dim: str, registro: dict[str, Any]) -> Optional[int]:
+        """Retorna a sk da dimensão para o registro, inserindo a linha na dimensão se for nova."""
+        tabela, colunas = DIMENSOES[dim]
+        # colunas TEXT: normaliza para str para casar com o que volta do banco
+        valores = tuple(None if registro.get(c) is None else str(registro.get(c)) for c in colunas)
+        if all(v is None for v in valores):
+            return None
+        sk = self._chaves[dim].get(valores)
+        if sk is None:
+            placeholders = ",".join("?" for _ in valores)
+            cur = self.conn.execute(
+                f"INSERT INTO {tabela} ({', '.join(colunas.values())}) VALUES ({placeholders})",
+                valores)
+            sk = self._chaves[dim][valores] = cur.lastrowid
+        return sk
+
+
+def inserir_licitacao(conn: sqlite3.Connection, cache: CacheDimensoes, registro: dict[str, Any]) -> None:
+    """Grava uma licitação (dict com as chaves JSON da busca) em licitacoes_fato, ignorando ids repetidos."""
+    if conn.execute("SELECT 1 FROM licitacoes_fato WHERE id=?", (registro["id"],)).fetchone():
+        return
+    linha = {k: v for k, v in registro.items() if k not in COLUNAS_DIMENSAO}
+    for dim in DIMENSOES:
+        linha[f"{dim}_sk"] = cache.chave(dim, registro)
+    cols = list(linha.keys())
+    placeholders = ",".join("?" for _ in cols)
+    cols_escaped = [f'"{c}"' if c.lower()=="index" else c for c in cols]
+    conn.execute(f"INSERT OR IGNORE INTO licitacoes_fato ({','.join(cols_escaped)}) VALUES ({placeholders})",
+                 [linha[k] for k in cols])
+
+
+# ============ MIGRAÇÃO ============
+def preparar_banco(conn: sqlite3.Connection) -> bool:
+    """
+    Cria dimensões, licitacoes_fato e a view licitacoes. Se o banco ainda tiver a
+    tabela licitacoes antiga, copia as linhas para o novo esquema e a remove.
+    Retorna True quando houve migração.
+    """
+    conn.executescript(SCHEMA_SQL)
+    tipo = conn.execute("SELECT type FROM sqlite_master WHERE name='licitacoes'").fetchone()
+    migrou = tipo is not None and tipo[0] == "table"
+    if migrou:
+        conn.row_factory, row_factory = sqlite3.Row, conn.row_factory
+        try:
+            conn.execute("BEGIN")
+            cache = CacheDimensoes(conn)
+            for row in conn.execute("SELECT * FROM licitacoes").fetchall():
+                inserir_licitacao(conn, cache, dict(row))
+            conn.execute("DROP TABLE licitacoes")
+            conn.execute(VIEW_SQL)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.row_factory = row_factory
+        # devolve ao sistema as páginas liberadas pela tabela antiga
+        conn.execute("VACUUM")
+    else:
+        conn.executescript(VIEW_SQL)
+    return migrou
+
+
+if __name__ == "__main__":
+    db_path = sys.argv[1] if len(sys.argv) > 1 else "database_lite.db"
+    conn = sqlite3.connect(db_path)
+    if preparar_banco(conn):
+        print(f"{db_path}: licitacoes migrada para dimensões")
+    else:
+        print(f"{db_path}: esquema já normalizado")
+    conn.close()
@@ -1,4 +1,56 @@
-CREATE TABLE licitacoes (
+-- dimensões (sk = chave substituta inteira)
+CREATE TABLE IF NOT EXISTS dim_orgao (
+    sk INTEGER PRIMARY KEY,
+    id TEXT,
+    cnpj TEXT,
+    nome TEXT,
+    UNIQUE (id, cnpj, nome)
+);
+CREATE TABLE IF NOT EXISTS dim_unidade (
+    sk INTEGER PRIMARY KEY,
+    id TEXT,
+    codigo TEXT,
+    nome TEXT,
+    UNIQUE (id, codigo, nome)
+);
+CREATE TABLE IF NOT EXISTS dim_esfera (
+    sk INTEGER PRIMARY KEY,
+    id TEXT,
+    nome TEXT,
+    UNIQUE (id, nome)
+);
+CREATE TABLE IF NOT EXISTS dim_poder (
+    sk INTEGER PRIMARY KEY,
+    id TEXT,
+    nome TEXT,
+    UNIQUE (id, nome)
+);
+CREATE TABLE IF NOT EXISTS dim_municipio (
+    sk INTEGER PRIMARY KEY,
+    id TEXT,
+    nome TEXT,
+    uf TEXT,
+    UNIQUE (id, nome, uf)
+);
+CREATE TABLE IF NOT EXISTS dim_modalidade (
+    sk INTEGER PRIMARY KEY,
+    id TEXT,
+    nome TEXT,
+    UNIQUE (id, nome)
+);
+CREATE TABLE IF NOT EXISTS dim_situacao (
+    sk INTEGER PRIMARY KEY,
+    id TEXT,
+    nome TEXT,
+    UNIQUE (id, nome)
+);
+CREATE INDEX IF NOT EXISTS idx_dim_orgao_nome      ON dim_orgao(nome);
+CREATE INDEX IF NOT EXISTS idx_dim_municipio_nome  ON dim_municipio(nome);
+CREATE INDEX IF NOT EXISTS idx_dim_modalidade_nome ON dim_modalidade(nome);
+CREATE INDEX IF NOT EXISTS idx_dim_situacao_nome   ON dim_situacao(nome);
+
+-- licitacoes_fato (colunas = chaves JSON, exceto as que foram para as dimensões)
+CREATE TABLE IF NOT EXISTS licitacoes_fato (
     id TEXT PRIMARY KEY,
     "index" TEXT,
     doc_type TEXT,
@@ -12,25 +64,15 @@ CREATE TABLE licitacoes (
     numero_sequencial INTEGER,
     numero_sequencial_compra_ata INTEGER,
     numero_controle_pncp TEXT,
-    orgao_id TEXT,
-    orgao_cnpj TEXT,
-    orgao_nome TEXT,
+    orgao_sk INTEGER REFERENCES dim_orgao(sk),
     orgao_subrogado_id TEXT,
     orgao_subrogado_nome TEXT,
-    unidade_id TEXT,
-    unidade_codigo TEXT,
-    unidade_nome TEXT,
-    esfera_id TEXT,
-    esfera_nome TEXT,
-    poder_id TEXT,
-    poder_nome TEXT,
-    municipio_id TEXT,
-    municipio_nome TEXT,
-    uf TEXT,
-    modalidade_licitacao_id TEXT,
-    modalidade_licitacao_nome TEXT,
-    situacao_id TEXT,
-    situacao_nome TEXT,
+    unidade_sk INTEGER REFERENCES dim_unidade(sk),
+    esfera_sk INTEGER REFERENCES dim_esfera(sk),
+    poder_sk INTEGER REFERENCES dim_poder(sk),
+    municipio_sk INTEGER REFERENCES dim_municipio(sk),
+    modalidade_sk INTEGER REFERENCES dim_modalidade(sk),
+    situacao_sk INTEGER REFERENCES dim_situacao(sk),
     data_publicacao_pncp DATETIME,
     data_atualizacao_pncp DATETIME,
     data_assinatura DATETIME,
@@ -42,5 +84,43 @@ CREATE TABLE licitacoes (
     tipo_id TEXT,
     tipo_nome TEXT,
     tipo_contrato_id TEXT,
+    fonte_orcamentaria TEXT,
+    fonte_orcamentaria_id TEXT,
+    fonte_orcamentaria_nome TEXT,
     tipo_contrato_nome TEXT
-)
+);
+CREATE INDEX IF NOT EXISTS idx_licitacoes_fato_controle
+  ON licitacoes_fato(numero_controle_pncp);
+CREATE INDEX IF NOT EXISTS idx_licitacoes_fato_orgao      ON licitacoes_fato(orgao_sk);
+CREATE INDEX IF NOT EXISTS idx_licitacoes_fato_municipio  ON licitacoes_fato(municipio_sk);
+CREATE INDEX IF NOT EXISTS idx_licitacoes_fato_modalidade ON licitacoes_fato(modalidade_sk);
+CREATE INDEX IF NOT EXISTS idx_licitacoes_fato_situacao   ON licitacoes_fato(situacao_sk);
+
+CREATE VIEW IF NOT EXISTS licitacoes AS
+SELECT
+    f.id, f."index", f.doc_type, f.title, f.description, f.item_url, f.document_type,
+    f.createdAt, f.numero, f.ano, f.numero_sequencial, f.numero_sequencial_compra_ata,
+    f.numero_controle_pncp,
+    o.id AS orgao_id, o.cnpj AS orgao_cnpj, o.nome AS orgao_nome,
+    f.orgao_subrogado_id, f.orgao_subrogado_nome,
+    u.id AS unidade_id, u.codigo AS unidade_codigo, u.nome AS unidade_nome,
+    e.id AS esfera_id, e.nome AS esfera_nome,
+    p.id AS poder_id, p.nome AS poder_nome,
+    m.id AS municipio_id, m.nome AS municipio_nome, m.uf AS uf,
+    ml.id AS modalidade_licitacao_id, ml.nome AS modalidade_licitacao_nome,
+    s.id AS situacao_id, s.nome AS situacao_nome,
+    f.data_publicacao_pncp, f.data_atualizacao_pncp, f.data_assinatura,
+    f.data_inicio_vigencia, f.data_fim_vigencia, f.cancelado, f.valor_global,
+    f.tem_resultado, f.tipo_id, f.tipo_nome, f.tipo_contrato_id,
+    f.fonte_orcamentaria, f.fonte_orcamentaria_id, f.fonte_orcamentaria_nome,
+    f.tipo_contrato_nome,
+    f.orgao_sk, f.unidade_sk, f.esfera_sk, f.poder_sk,
+    f.municipio_sk, f.modalidade_sk, f.situacao_sk
+FROM licitacoes_fato f
+LEFT JOIN dim_orgao      o  ON o.sk  = f.orgao_sk
+LEFT JOIN dim_unidade    u  ON u.sk  = f.unidade_sk
+LEFT JOIN dim_esfera     e  ON e.sk  = f.esfera_sk
+LEFT JOIN dim_poder      p  ON p.sk  = f.poder_sk
+LEFT JOIN dim_municipio  m  ON m.sk  = f.municipio_sk
+LEFT JOIN dim_modalidade ml ON ml.sk = f.modalidade_sk
+LEFT JOIN dim_situacao   s  ON s.sk  = f.situacao_sk;
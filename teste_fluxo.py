@@ -2,6 +2,7 @@
 import asyncio, aiohttp, sqlite3, requests, re, json
 from datetime import datetime, timezone
 from markitdown import MarkItDown
+from dimensoes import CacheDimensoes, inserir_licitacao, preparar_banco
 
 # ============ CONFIG ============
 SEARCH_URL   = "https://pncp.gov.br/api/search/"
@@ -25,59 +26,6 @@ conn = sqlite3.connect(DB_PATH)
 c = conn.cursor()
 
 c.executescript("""
--- licitacoes (colunas = chaves JSON)
-CREATE TABLE IF NOT EXISTS licitacoes (
-    id TEXT PRIMARY KEY,
-    "index" TEXT,
-    doc_type TEXT,
-    title TEXT,
-    description TEXT,
-    item_url TEXT,
-    document_type TEXT,
-    createdAt DATETIME,
-    numero TEXT,
-    ano INTEGER,
-    numero_sequencial INTEGER,
-    numero_sequencial_compra_ata INTEGER,
-    numero_controle_pncp TEXT,
-    orgao_id TEXT,
-    orgao_cnpj TEXT,
-    orgao_nome TEXT,
-    orgao_subrogado_id TEXT,
-    orgao_subrogado_nome TEXT,
-    unidade_id TEXT,
-    unidade_codigo TEXT,
-    unidade_nome TEXT,
-    esfera_id TEXT,
-    esfera_nome TEXT,
-    poder_id TEXT,
-    poder_nome TEXT,
-    municipio_id TEXT,
-    municipio_nome TEXT,
-    uf TEXT,
-    modalidade_licitacao_id TEXT,
-    modalidade_licitacao_nome TEXT,
-    situacao_id TEXT,
-    situacao_nome TEXT,
-    data_publicacao_pncp DATETIME,
-    data_atualizacao_pncp DATETIME,
-    data_assinatura DATETIME,
-    data_inicio_vigencia DATETIME,
-    data_fim_vigencia DATETIME,
-    cancelado BOOLEAN,
-    valor_global REAL,
-    tem_resultado BOOLEAN,
-    tipo_id TEXT,
-    tipo_nome TEXT,
-    tipo_contrato_id TEXT,
-    fonte_orcamentaria TEXT,
-    fonte_orcamentaria_id TEXT,
-    fonte_orcamentaria_nome TEXT,
-    tipo_contrato_nome TEXT
-);
-CREATE INDEX IF NOT EXISTS idx_licitacoes_controle
-  ON licitacoes(numero_controle_pncp);
-
 -- itens
 CREATE TABLE IF NOT EXISTS itens (
     id_licitacao TEXT,
@@ -114,6 +62,10 @@ CREATE TABLE IF NOT EXISTS arquivo_markdown (
 """)
 conn.commit()
 
+# licitacoes: dimensões com chave inteira + view de compatibilidade (migra banco antigo)
+preparar_banco(conn)
+cache_dim = CacheDimensoes(conn)
+
 sem = asyncio.Semaphore(MAX_CONN)
 
 # ============ FETCH ============
@@ -198,13 +150,9 @@ async def main():
     novos   = ids_all - ids_db
     log(f"NOVOS {len(novos)} / TOTAL {len(ids_all)}")
 
-    # inserção direta (colunas iguais às chaves)
+    # inserção (colunas iguais às chaves; textos repetidos resolvidos para chaves das dimensões)
     for it in primarios:
-        cols = list(it.keys())
-        placeholders = ",".join("?" for _ in cols)
-        cols_escaped = [f'"{c}"' if c.lower()=="index" else c for c in cols]
-        c.execute(f"INSERT OR IGNORE INTO licitacoes ({','.join(cols_escaped)}) VALUES ({placeholders})",
-                  [it[k] for k in cols])
+        inserir_licitacao(conn, cache_dim, it)
     conn.commit()
 
     # Fase 1: processar somente os novos, buscar itens/arquivos e inserir no banco, coletar arquivos para conversão
@@ -289,13 +237,9 @@ async def main():
     novos   = ids_all - ids_db
     log(f"NOVOS {len(novos)} / TOTAL {len(ids_all)}")
 
-    # inserção direta (colunas iguais às chaves)
+    # inserção (colunas iguais às chaves; textos repetidos resolvidos para chaves das dimensões)
     for it in primarios:
-        cols = list(it.keys())
-        placeholders = ",".join("?" for _ in cols)
-        cols_escaped = [f'"{c}"' if c.lower()=="index" else c for c in cols]
-        c.execute(f"INSERT OR IGNORE INTO licitacoes ({','.join(cols_escaped)}) VALUES ({placeholders})",
-                  [it[k] for k in cols])
+        inserir_licitacao(conn, cache_dim, it)
     conn.commit()
 
     # Fase 1: processar somente os novos, buscar itens/arquivos e inserir no banco, coletar arquivos para conversão